@@ -126,14 +126,17 @@ def activate_project(project):
     print("io.activate_project is deprecated")
 
 
-def projects():
+def projects(*args, **kwargs):
     """List available projects
 
+    Arguments are forwarded to the connection, e.g. `projection` to
+    limit each document to the fields a caller actually reads.
+
     Returns:
         list of project documents
 
     """
-    return self._connection_object.projects()
+    return self._connection_object.projects(*args, **kwargs)
 
 
 def locate(path):
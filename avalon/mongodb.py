@@ -2,6 +2,7 @@ import os
 import time
 import functools
 import logging
+import threading
 import pymongo
 import ctypes
 from uuid import uuid4
@@ -150,6 +151,7 @@ class AvalonMongoConnection:
     _mongo_client = None
     _is_installed = False
     _databases = {}
+    _installation_lock = threading.Lock()
     log = logging.getLogger("AvalonMongoConnection")
 
     @classmethod
@@ -173,8 +175,12 @@ class AvalonMongoConnection:
     @classmethod
     def install(cls, dbcon):
         if not cls._is_installed or cls._mongo_client is None:
-            cls._mongo_client = cls.create_connection()
-            cls._is_installed = True
+            # Double-checked lock so concurrent installs from multiple
+            # tools share a single MongoClient.
+            with cls._installation_lock:
+                if not cls._is_installed or cls._mongo_client is None:
+                    cls._mongo_client = cls.create_connection()
+                    cls._is_installed = True
 
         cls.register_database(dbcon)
         cls._databases[dbcon.id]["installed"] = True
@@ -224,8 +230,9 @@ class AvalonMongoConnection:
         for db_id, info in cls._databases.items():
             obj = info["object"]
             # TODO check if should check for 1 or more
-            cls.log.info(ctypes.c_long.from_address(id(obj)).value)
-            if ctypes.c_long.from_address(id(obj)).value == 1:
+            ref_count = ctypes.c_long.from_address(id(obj)).value
+            cls.log.info(ref_count)
+            if ref_count == 1:
                 items_to_pop.add(db_id)
 
         for db_id in items_to_pop:
@@ -242,6 +249,10 @@ class AvalonMongoConnection:
         return mongo_client
 
 
+# Sentinel for missing collection attributes, shared by all lookups
+_NOT_SET = object()
+
+
 class AvalonMongoDB:
     def __init__(self, session=None, auto_install=True):
         self._id = uuid4()
@@ -274,10 +285,9 @@ class AvalonMongoDB:
             )
 
         collection = self._database[project_name]
-        not_set = object()
-        attr = getattr(collection, attr_name, not_set)
+        attr = getattr(collection, attr_name, _NOT_SET)
 
-        if attr is not_set:
+        if attr is _NOT_SET:
             # Raise attribute error
             raise AttributeError(
                 "{} has no attribute '{}'.".format(
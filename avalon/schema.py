@@ -26,6 +26,9 @@ ValidationError = jsonschema.ValidationError
 SchemaError = jsonschema.SchemaError
 
 _CACHED = False
+_RESOLVER = None
+
+_SCHEMA_NAME_REGEX = re.compile(r"[^:]+:[^-]+-(\d.\d)")
 
 
 def get_schema_version(schema_name):
@@ -47,8 +50,7 @@ def get_schema_version(schema_name):
     second. When schema does not match parsing regex then `(0, 0)` is
     returned.
     """
-    schema_regex = re.compile(r"[^:]+:[^-]+-(\d.\d)")
-    groups = schema_regex.findall(schema_name)
+    groups = _SCHEMA_NAME_REGEX.findall(schema_name)
     if not groups:
         return 0, 0
 
@@ -67,6 +69,8 @@ def validate(data, schema=None):
         ValidationError on invalid schema
 
     """
+    global _RESOLVER
+
     if not _CACHED:
         _precache()
 
@@ -80,12 +84,16 @@ def validate(data, schema=None):
     if isinstance(schema, six.string_types):
         schema = _cache[schema + ".json"]
 
-    resolver = jsonschema.RefResolver(
-        "",
-        None,
-        store=_cache,
-        cache_remote=True
-    )
+    # The resolver snapshots `_cache` on construction, so build it only
+    # once all schemas are precached and reuse it for subsequent calls.
+    if _RESOLVER is None:
+        _RESOLVER = jsonschema.RefResolver(
+            "",
+            None,
+            store=_cache,
+            cache_remote=True
+        )
+    resolver = _RESOLVER
 
     jsonschema.validate(data,
                         schema,
@@ -132,9 +140,10 @@ def _precache():
             continue
         if not schema.endswith(".json"):
             continue
-        if not os.path.isfile(os.path.join(schema_dir, schema)):
+        schema_path = os.path.join(schema_dir, schema)
+        if not os.path.isfile(schema_path):
             continue
-        with open(os.path.join(schema_dir, schema)) as f:
+        with open(schema_path) as f:
             log_.debug("Installing schema '%s'.." % schema)
             _cache[schema] = json.load(f)
     _CACHED = True